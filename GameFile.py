@@ -1,9 +1,166 @@
 # File containing the GameBase class and the PokerGame class which inherits from GameBase
 
-from SpriteFile import Card, Deck, Button
+from SpriteFile import Card, Deck, Button, RANK_PRIMES
+from bisect import bisect_left
+from functools import lru_cache, reduce
+from itertools import combinations, combinations_with_replacement
+from operator import and_, mul
 import pygame
 import time
 
+# Posted once the computer has finished waiting to make its move
+COMPUTER_MOVE_EVENT = pygame.USEREVENT + 1
+
+# The card types in order of lowest to highest rank, and the rank index of each card type
+_RANK_ORDER = tuple(Deck.TYPES[1:]) + ("Ace",)
+_RANK_INDEX = {name: i for i, name in enumerate(_RANK_ORDER)}
+
+# The bitmask of the ranks in every straight, where bit 0 is a Two and bit 12 is an Ace. The ace is low in the wheel
+_WHEEL_MASK = 0b1000000001111
+_STRAIGHT_MASKS = frozenset([0b11111 << lowestRank for lowestRank in range(9)] + [_WHEEL_MASK])
+
+
+def _countRanks(cardCodes):
+    """
+    Counts how many times each card rank appears in a set of cards
+    :param cardCodes: the codes of the cards (see Card.getCode)
+    :return: a list of 13 counts, one for each rank from Two to Ace
+    """
+    occurrences = [0] * len(Deck.TYPES)
+
+    for code in cardCodes:
+        occurrences[code >> 2] += 1
+
+    return occurrences
+
+
+def _getHandOrder(ranks, isFlush):
+    """
+    Gets the value used to sort card hands from best to worst
+    :param ranks: the rank indices of the cards in the hand (0 for Two up to 12 for Ace)
+    :param isFlush: whether or not every card in the hand has the same suit
+    :return: a tuple of the hand's category (its index in PokerGame._CARD_HANDS) followed by its tie-breaking ranks,
+             where a smaller tuple is a better hand
+    """
+    # The ranks are ordered by how often they appear first (e.g. the three in a full house) and then by rank
+    counts = sorted([(ranks.count(rank), rank) for rank in set(ranks)], reverse=True)
+    shape = [count for count, rank in counts]
+    tieBreakers = tuple([-rank for count, rank in counts])
+
+    rankMask = sum([1 << rank for rank in set(ranks)])
+    isStraight = len(ranks) == 5 and rankMask in _STRAIGHT_MASKS
+    if rankMask == _WHEEL_MASK:  # The ace is low, so the straight is only as high as the five
+        tieBreakers = (-3,)
+
+    if isFlush and isStraight:
+        return (0 if tieBreakers[0] == -12 else 1,) + tieBreakers
+    elif shape[0] >= 4:  # Five of the same rank can only happen with more than one deck, and counts as four
+        return (2,) + tieBreakers
+    elif shape[:2] == [3, 2]:
+        return (3,) + tieBreakers
+    elif isFlush:
+        return (4,) + tieBreakers
+    elif isStraight:
+        return (5,) + tieBreakers
+    elif shape[0] == 3:
+        return (6,) + tieBreakers
+    elif shape[:2] == [2, 2]:
+        return (7,) + tieBreakers
+    elif shape[0] == 2:
+        return (8,) + tieBreakers
+
+    return (9,) + tieBreakers
+
+
+def _buildHandLookupTables():
+    """
+    Ranks all 7462 distinct 5-card hands from 1 (a royal flush) to 7462 (the worst hand with no pair)
+    :return: the ranks of flush hands keyed by a bitmask of their card ranks, the ranks of every other hand keyed by
+             the product of their rank primes, and the worst rank found in each category of PokerGame._CARD_HANDS
+    """
+    hands = []
+    for ranks in combinations_with_replacement(range(len(Deck.TYPES)), 5):
+        if max([ranks.count(rank) for rank in ranks]) > 4:  # There are only four suits of each rank
+            continue
+
+        hands.append((_getHandOrder(ranks, False), ranks, False))
+        if len(set(ranks)) == 5:  # Only five different ranks can make a flush
+            hands.append((_getHandOrder(ranks, True), ranks, True))
+
+    hands.sort()
+
+    flushLookup = {}
+    nonFlushLookup = {}
+    categoryBounds = [0] * 10
+
+    for handRank, (order, ranks, isFlush) in enumerate(hands, 1):
+        if isFlush:
+            flushLookup[sum([1 << rank for rank in ranks])] = handRank
+        else:
+            nonFlushLookup[reduce(mul, [RANK_PRIMES[rank] for rank in ranks])] = handRank
+
+        categoryBounds[order[0]] = handRank
+
+    return flushLookup, nonFlushLookup, categoryBounds
+
+
+# Built once when the game is loaded, so checking a hand is only a few dictionary lookups
+_FLUSH_LOOKUP, _NON_FLUSH_LOOKUP, _HAND_CATEGORY_BOUNDS = _buildHandLookupTables()
+
+
+# The rank prime, rank bit and suit bit of each card code, so looking up a hand needs no bit shifting
+_CODE_PRIMES = tuple([RANK_PRIMES[code >> 2] for code in range(52)])
+_CODE_RANK_BITS = tuple([1 << (code >> 2) for code in range(52)])
+_CODE_SUIT_BITS = tuple([0x100 << (code & 3) for code in range(52)])
+
+
+def _lookUpHandRank(cardCodes):
+    """
+    Looks up the rank of a 5-card hand out of every possible 5-card hand
+    :param cardCodes: the codes of the five cards (see Card.getCode)
+    :return: the rank of the hand, from 1 (a royal flush) to 7462 (the worst hand with no pair)
+    """
+    c1, c2, c3, c4, c5 = cardCodes
+
+    if _CODE_SUIT_BITS[c1] & _CODE_SUIT_BITS[c2] & _CODE_SUIT_BITS[c3] & _CODE_SUIT_BITS[c4] & _CODE_SUIT_BITS[c5]:
+        return _FLUSH_LOOKUP[_CODE_RANK_BITS[c1] | _CODE_RANK_BITS[c2] | _CODE_RANK_BITS[c3] | _CODE_RANK_BITS[c4]
+                             | _CODE_RANK_BITS[c5]]
+
+    return _NON_FLUSH_LOOKUP[_CODE_PRIMES[c1] * _CODE_PRIMES[c2] * _CODE_PRIMES[c3] * _CODE_PRIMES[c4]
+                             * _CODE_PRIMES[c5]]
+
+
+@lru_cache(maxsize=4096)
+def _evaluateHand(cardCodes):
+    """
+    Finds the category of the best 5-card hand that can be made from a set of cards. The result is cached, since the
+    same cards get checked again after each bet in a round
+    :param cardCodes: a sorted tuple of the codes of the playing cards (see Card.getCode)
+    :return: the index of the best hand's category in PokerGame._CARD_HANDS
+    """
+    if len(cardCodes) < 5:  # Only hands made from cards of the same rank are possible without five cards
+        return _getHandOrder([code >> 2 for code in cardCodes], False)[0]
+
+    # The same card can only be dealt twice when several decks are shuffled together. The lookup tables only hold hands
+    #   from a single deck, so these hands get ordered directly instead
+    if len(set(cardCodes)) < len(cardCodes):
+        return min([_getHandOrder([code >> 2 for code in hand], len(set([code & 3 for code in hand])) == 1)
+                    for hand in combinations(cardCodes, 5)])[0]
+
+    suitCounts = [0] * len(Deck.SUITS)
+    for code in cardCodes:
+        suitCounts[code & 3] += 1
+
+    # Every possible 5-card combination from the cards gets looked up, and the best one is kept. If no five cards share
+    #   a suit, none of the combinations can be a flush, so only the rank primes are needed
+    if max(suitCounts) < 5:
+        primes = [_CODE_PRIMES[code] for code in cardCodes]
+        bestRank = min([_NON_FLUSH_LOOKUP[p1 * p2 * p3 * p4 * p5] for p1, p2, p3, p4, p5 in combinations(primes, 5)])
+    else:
+        bestRank = min([_lookUpHandRank(hand) for hand in combinations(cardCodes, 5)])
+
+    return bisect_left(_HAND_CATEGORY_BOUNDS, bestRank)
+
 
 ##
 # A GameBase superclass that implements all the functionalities of pygame but makes everything more simplified
@@ -22,8 +179,15 @@ class GameBase:
         self._display = pygame.display.set_mode((self._width, self._height))
         self._clock = pygame.time.Clock()
         self._framesPerSecond = 30
-        self._sprites = pygame.sprite.LayeredUpdates()
+        self._idleFramesPerSecond = 10  # Used when nothing on the canvas is changing
+        self._sprites = pygame.sprite.RenderUpdates()
         self._ticks = 0
+        self._needsRedraw = True  # The canvas only gets redrawn when something on it may have changed
+
+        # Used to cover up the spots that sprites were drawn at in the last frame
+        WHITE = (255, 255, 255)
+        self._background = pygame.Surface((self._width, self._height))
+        self._background.fill(WHITE)
         pygame.key.set_repeat(1, 120)
 
     def getDisplay(self):
@@ -54,6 +218,13 @@ class GameBase:
         """
         return self._framesPerSecond
 
+    def getIdleFramesPerSecond(self):
+        """
+        Gets the number of frames per second being displayed while nothing on the canvas is changing.
+        :return: the idle frames per second
+        """
+        return self._idleFramesPerSecond
+
     def getCanvasDimensions(self):
         """
         Gets the width/height dimension of the canvas.
@@ -82,15 +253,23 @@ class GameBase:
         self._sprites.update()
 
     def draw(self):
-        """  Draws the sprites on the canvas  """
-        self._sprites.draw(self._display)
+        """
+        Draws the sprites on the canvas
+        :return: a list of the areas of the canvas which have changed since the last time the sprites were drawn
+        """
+        return self._sprites.draw(self._display)
 
-    def add(self, sprite):
+    def add(self, *sprites):
         """
-        Adds a sprite to the group of sprites for the canvas
-        :param sprite: the sprite to be added to the group
+        Adds one or more sprites to the group of sprites for the canvas
+        :param sprites: the sprites to be added to the group
         """
-        self._sprites.add(sprite)
+        self._sprites.add(*sprites)
+        self._needsRedraw = True
+
+    def requestRedraw(self):
+        """  Makes the canvas get redrawn on the next frame (e.g. after a sprite's image has been changed)  """
+        self._needsRedraw = True
 
     def updateTicks(self, value):
         """
@@ -107,21 +286,38 @@ class GameBase:
     def run(self):
         """  Runs the pygame window and keeps track of any events from the user  """
 
+        # The whole window only needs to be filled once, since only the areas that change get redrawn after this
+        self._display.blit(self._background, (0, 0))
+        pygame.display.update()
+
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.quit()
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     self.mouseButtonDown(event.pos[0], event.pos[1])
+                    self._needsRedraw = True
                 elif event.type == pygame.KEYDOWN:
                     self.keyDown(event.key)
+                    self._needsRedraw = True
 
             self.update()
-            WHITE = (255, 255, 255)
-            self._display.fill(WHITE)
-            self.draw()
-            pygame.display.update()
-            self._clock.tick(self._framesPerSecond)
+
+            # A sprite which was moved or taken out of the group since the last frame also needs to be redrawn
+            if not self._needsRedraw and (self._sprites.lostsprites or any(
+                    [sprite.rect != rect for sprite, rect in self._sprites.spritedict.items()])):
+                self._needsRedraw = True
+
+            # Nothing gets redrawn while the window is idle, and the loop slows down until something changes
+            if self._needsRedraw:
+                self._sprites.clear(self._display, self._background)
+                pygame.display.update(self.draw())
+                self._needsRedraw = False
+                fps = self._framesPerSecond
+            else:
+                fps = self._idleFramesPerSecond
+
+            self._clock.tick(fps)
             self._ticks = self._ticks + 1
 
 
@@ -131,11 +327,14 @@ class GameBase:
 class PokerGame(GameBase):
     _CARD_HANDS = ["Royal Flush", "Straight Flush", "Four of a Kind", "Full House", "Flush", "Straight",
                    "Three of a Kind", "Two Pairs", "One Pair", "No Pair"]
+    _CARD_HANDS_INDEX = {hand: i for i, hand in enumerate(_CARD_HANDS)}
 
     _MINIMUM_BET_WAGE = 20  # In dollars
     _START_BALANCE = 500  # In dollars
     _COMPUTER_WAIT_TIME = 1  # In seconds (The time the user waits for the computer to make a move)
     _TEXT_DATA_LENGTH = 6
+    _TEXT_LOCATIONS = [(250, 280), (250, 300), (250, 330), (250, 350), (425, 280), (425, 300)]
+    _HANDLED_EVENTS = [pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.VIDEOEXPOSE, COMPUTER_MOVE_EVENT]
 
     def __init__(self, width, height):
         """
@@ -145,7 +344,13 @@ class PokerGame(GameBase):
         """
         super().__init__(width, height)
         self._startTime = -1
-        self._textData = [] * self._TEXT_DATA_LENGTH
+        self._lastMousePos = None  # Where the mouse was the last time the window was drawn
+
+        # Only the events that the game uses get put into the event queue, and no sound is ever played
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._HANDLED_EVENTS)
+        pygame.mixer.quit()
+        self._textData = [None] * self._TEXT_DATA_LENGTH
 
         self._winner = "No Winner"
         self._userHand = "None"
@@ -154,7 +359,7 @@ class PokerGame(GameBase):
         self._roundHasEnded = False
         self._userFolded = False
         self._computerHasTurn = False
-        self._computerTurnStartTime = 0
+        self._clickabilityDirty = True  # Whether the game state changed, so the buttons' clickability may have too
 
         self._userMoney = self._START_BALANCE
         self._computerMoney = self._START_BALANCE
@@ -170,26 +375,44 @@ class PokerGame(GameBase):
         self._newRoundButton = Button((181, 223, 81), 130, 20, 100, 50, "Start New Round")
         self._exitGameButton = Button((210, 70, 38), 40, 20, 80, 50, "Exit Game")
 
+        # The buttons which can be clicked while a round is being played, and after it has ended
+        self._bettingButtons = [(self._foldButton, self.__fold), (self._callButton, self.__call),
+                                (self._raiseButton, self.__raise)]
+        self._roundEndButtons = [(self._newRoundButton, self.__startNewRound), (self._exitGameButton, self.quit)]
+
+        # The font is only loaded once, and text that never changes is only rendered once
+        self._font = pygame.font.SysFont("Arial", 15)
+        self._minimumWagerText = self._font.render("Minimum Wager: $" + str(self._MINIMUM_BET_WAGE), True,
+                                                   pygame.color.Color('#ffffff'))
+        self._computerTurnText = self._font.render("Computer is making a move...", True, (161, 29, 70))
+        self._textData[0] = self._minimumWagerText
+
         self._cardDeck = Deck(1)
         self._cardDeck.shuffle()
 
         self._blankCard = [Card("Unknown", 0, 0, "DECK_export/faceDown.gif"),
                            Card("Unknown", 0, 0, "DECK_export/faceDown.gif")]
 
-        super().add(self._blankCard[0])
-        super().add(self._blankCard[1])
+        super().add(*self._blankCard)
+
+        # A single placeholder card fills every card slot that hasn't been dealt to yet
+        self._emptyCard = Card("Empty")
 
-        self._userCard1 = Card("Empty")
-        self._userCard2 = Card("Empty")
-        self._computerCard1 = [Card("Empty"), self._blankCard[0]]
-        self._computerCard2 = [Card("Empty"), self._blankCard[1]]
+        self._userCard1 = self._emptyCard
+        self._userCard2 = self._emptyCard
+        self._computerCard1 = [self._emptyCard, self._blankCard[0]]
+        self._computerCard2 = [self._emptyCard, self._blankCard[1]]
 
-        self._displayCards = [Card("Empty"), Card("Empty"), Card("Empty"), Card("Empty"), Card("Empty")]
+        self._displayCards = [self._emptyCard] * 5
         self._cardsInDisplay = 0
 
-        # Adds each card sprite to the group of sprites linked to this canvas
-        for i in range(self._cardDeck.getNumOfCardsInDeck()):
-            super().add(self._cardDeck.viewCardAt(i))
+        # Adds every card sprite to the group of sprites linked to this canvas at once. The cards are then hidden (so
+        #   they aren't drawn) until they get dealt
+        super().add(*self._cardDeck.getCardsInDeck())
+        for card in self._cardDeck.getCardsInDeck():
+            card.hideCard()
+
+        self.__updateTextData()  # Every text slot has something in it before the first frame gets drawn
 
     def __startNewRound(self):
         """  Starts a new round of poker (a new round of betting)  """
@@ -201,12 +424,18 @@ class PokerGame(GameBase):
         self._currentPot = 0
         self._currentWager = self._MINIMUM_BET_WAGE
         self._currentBeingRisked = 0
+        self.__updateTextData()
+        self._clickabilityDirty = True
 
         self.__hideAllDisplayedCards()
+        for i in range(5):  # The last round's cards are going back into the deck, so they're no longer on display
+            self._displayCards[i] = self._emptyCard
+
         self._roundHasEnded = False
         self._userFolded = False
 
         self._cardsInDisplay = 0
+        _evaluateHand.cache_clear()  # The cache only needs to hold the hands from the current round
         self._cardDeck.addAllCardsBackIntoDeck()
         self._cardDeck.shuffle()
 
@@ -278,6 +507,7 @@ class PokerGame(GameBase):
         if (key == pygame.K_RETURN or key == pygame.K_q) \
                 and (self._startTime == -1 or (time.time() - self._startTime > 0.05)):
             self.__fold()
+            self._clickabilityDirty = True
             self._startTime = time.time()
 
     def mouseButtonDown(self, x, y):
@@ -291,17 +521,16 @@ class PokerGame(GameBase):
             return
 
         if not self._roundHasEnded:
-            if self._foldButton.mouseIsOver(pygame.mouse.get_pos()) and self._foldButton.isClickable():
-                self.__fold()
-            elif self._callButton.mouseIsOver(pygame.mouse.get_pos()) and self._callButton.isClickable():
-                self.__call()
-            elif self._raiseButton.mouseIsOver(pygame.mouse.get_pos()) and self._raiseButton.isClickable():
-                self.__raise()
+            buttons = self._bettingButtons
         else:
-            if self._newRoundButton.mouseIsOver(pygame.mouse.get_pos()) and self._newRoundButton.isClickable():
-                self.__startNewRound()
-            elif self._exitGameButton.mouseIsOver(pygame.mouse.get_pos()) and self._exitGameButton.isClickable():
-                super().quit()
+            buttons = self._roundEndButtons
+
+        pos = x, y
+        for button, action in buttons:
+            if button.mouseIsOver(pos) and button.isClickable():
+                action()
+                self._clickabilityDirty = True
+                break
 
     def __fold(self):
         """  Simulates the user folding in Texas Hold 'em, where all money in the pot goes to the computer  """
@@ -383,36 +612,27 @@ class PokerGame(GameBase):
         self._computerMoney -= self._currentWager
         self._currentPot += self._currentWager
         self._computerHasTurn = True
-        self._computerTurnStartTime = time.time()
+
+        # The computer's turn ends when this event gets posted (only once) after the wait time
+        pygame.time.set_timer(COMPUTER_MOVE_EVENT, int(self._COMPUTER_WAIT_TIME * 1000), 1)
 
     def __displayComputerTurnText(self):
         """  Displays some text that let's the user know that it's currently the computer's turn - Enhances gameplay """
 
-        font = pygame.font.SysFont("Arial", 15)
         if self._userHand == "None":
-            text = font.render("Computer is making a move...", True, (161, 29, 70))
-            super().getDisplay().blit(text, (50, 75))
+            super().getDisplay().blit(self._computerTurnText, (50, 75))
 
     def determineWinner(self):
         """  Determines who the winner is after no more bets are being placed (Who has the best hand)  """
 
-        # The card names, in order of lowest to highest score
-        aList = Deck.TYPES[1:] + ["Ace"]
-
         # The higher the score, the higher the high-card
-        userCardScore = aList.index(PokerGame.getHighCard([self._userCard1, self._userCard2]))
-        compCardScore = aList.index(PokerGame.getHighCard([self._computerCard1[0], self._computerCard2[0]]))
+        userCardScore = _RANK_INDEX[PokerGame.getHighCard([self._userCard1, self._userCard2])]
+        compCardScore = _RANK_INDEX[PokerGame.getHighCard([self._computerCard1[0], self._computerCard2[0]])]
 
         # if the userScore is positive, then the lowest user score is the winner - Same goes for the computer score
-        if self._userHand in self._CARD_HANDS:
-            userScore = self._CARD_HANDS.index(self._userHand)
-        else:
-            userScore = -1  # True if the user didn't have any card hand
-
-        if self._computerHand in self._CARD_HANDS:
-            computerScore = self._CARD_HANDS.index(self._computerHand)
-        else:
-            computerScore = -1
+        # A score of -1 means that there wasn't any card hand
+        userScore = self._CARD_HANDS_INDEX.get(self._userHand, -1)
+        computerScore = self._CARD_HANDS_INDEX.get(self._computerHand, -1)
 
         # If the user or computer score is -1, then the high card is executed as the best hand
         if userScore >= 0 and computerScore >= 0:
@@ -456,15 +676,13 @@ class PokerGame(GameBase):
     def displayWinner(self):
         """  Displays the winner as text being blitted to the screen  """
 
-        font = pygame.font.SysFont("Arial", 15)
-
         if self._userFolded:
-            text = font.render("Since you folded, " + self._winner + " wins the pot!", True, (161, 29, 70))
+            text = self._font.render("Since you folded, " + self._winner + " wins the pot!", True, (161, 29, 70))
         else:
-            text = font.render(self._winner + " wins!", True, (161, 29, 70))
+            text = self._font.render(self._winner + " wins!", True, (161, 29, 70))
 
-        text2 = font.render("Your best hand: " + self._userHand, True, (161, 29, 70))
-        text3 = font.render("Computer's best hand: " + self._computerHand, True, (161, 29, 70))
+        text2 = self._font.render("Your best hand: " + self._userHand, True, (161, 29, 70))
+        text3 = self._font.render("Computer's best hand: " + self._computerHand, True, (161, 29, 70))
         super().getDisplay().blit(text, (50, 75))
         super().getDisplay().blit(text2, (50, 95))
         super().getDisplay().blit(text3, (50, 115))
@@ -472,64 +690,60 @@ class PokerGame(GameBase):
     def __updateTextData(self):
         """  Updates the text data which is displayed on the bottom right of the window  """
 
-        font = pygame.font.SysFont("Arial", 15)
-
-        text1 = font.render("Minimum Wager: $" + str(self._MINIMUM_BET_WAGE), True, pygame.color.Color('#ffffff'))
-        text2 = font.render("Current Wager: $" + str(self._currentWager), True, pygame.color.Color('#ffffff'))
-        text3 = font.render("Amount at Risk: $" + str(self._currentBeingRisked), True, pygame.color.Color('#ffffff'))
-        text4 = font.render("Current pot: $" + str(self._currentPot), True, pygame.color.Color('#ffffff'))
-        text5 = font.render("Available Balance: $" + str(self._userMoney), True, pygame.color.Color('#ffffff'))
-        text6 = font.render("Computer Balance: $" + str(self._computerMoney), True, pygame.color.Color('#ffffff'))
+        font = self._font
+        textData = self._textData  # The first line (the minimum wager) never changes, so it's never re-rendered
 
-        self._textData = [text1, text2, text3, text4, text5, text6]
+        textData[1] = font.render("Current Wager: $" + str(self._currentWager), True, pygame.color.Color('#ffffff'))
+        textData[2] = font.render("Amount at Risk: $" + str(self._currentBeingRisked), True,
+                                  pygame.color.Color('#ffffff'))
+        textData[3] = font.render("Current pot: $" + str(self._currentPot), True, pygame.color.Color('#ffffff'))
+        textData[4] = font.render("Available Balance: $" + str(self._userMoney), True, pygame.color.Color('#ffffff'))
+        textData[5] = font.render("Computer Balance: $" + str(self._computerMoney), True,
+                                  pygame.color.Color('#ffffff'))
 
-    def __blitTextData(self):
-        """  Blits all of the text data which is displayed on the bottom right of the window  """
-
-        locations = [(250, 280), (250, 300), (250, 330), (250, 350), (425, 280), (425, 300)]
-
-        # Both values should always be equal, but just in case...
-        if len(self._textData) < len(locations):
-            count = len(self._textData)
+    def __renderUI(self, mousePos, window):
+        """
+        Draws all of the buttons and text for the current state of the game onto the window in a single pass
+        :param mousePos: the current position of the mouse
+        :param window: the window which the buttons and text are drawn onto
+        """
+        # Don't display the buttons during the short period when it's the computer's turn
+        if self._computerHasTurn:
+            self.__displayComputerTurnText()  # Execute text when it's the computer's turn
+        elif not self._roundHasEnded:
+            # The call, fold, and raise buttons
+            self._callButton.updateText("Call ($" + str(self._currentWager) + ")")
+            self._raiseButton.updateText("Raise ($" + str(self._currentWager) + ")")
+
+            self._foldButton.drawButton(window, 15, mousePos)
+            self._callButton.drawButton(window, 15, mousePos)
+            self._raiseButton.drawButton(window, 12, mousePos)
         else:
-            count = len(locations)
-
-        # Blit all of the text in the text list
-        for i in range(count):
-            super().getDisplay().blit(self._textData[i], locations[i])
-
-    def __displayButtonData(self):
-        """  Displays the call, fold, and raise buttons on the window  """
-
-        self._callButton.updateText("Call ($" + str(self._currentWager) + ")")
-        self._raiseButton.updateText("Raise ($" + str(self._currentWager) + ")")
-
-        self._foldButton.drawButton(super().getDisplay(), 15)
-        self._callButton.drawButton(super().getDisplay(), 15)
-        self._raiseButton.drawButton(super().getDisplay(), 12)
+            # The winner and the two game option buttons
+            self.displayWinner()
+            self._newRoundButton.drawButton(window, 10, mousePos)
+            self._exitGameButton.drawButton(window, 12, mousePos)
 
-    def __displayGameOptions(self):
-        """  Displays the two game option buttons (after a winner has been determined)  """
-
-        self._newRoundButton.drawButton(super().getDisplay(), 10)
-        self._exitGameButton.drawButton(super().getDisplay(), 12)
+        # The text data on the bottom right of the window is blitted in a single call. It's only re-rendered when the
+        #   numbers change, and zip() stops at the shorter list, just in case they differ
+        window.blits(list(zip(self._textData, self._TEXT_LOCATIONS)), False)
 
     def __checkForClickabilityChanges(self):
         """  Checks to see if the clickability of certain buttons needs to be changed  """
 
         # Buttons used for betting
         if self._userMoney < self._currentWager * 2:  # True if the user couldn't afford to raise the bet
-            self._raiseButton.changeClickability(False, super().getDisplay(), 12)
+            self._raiseButton.changeClickability(False)
         elif not self._raiseButton.isClickable() and self._userMoney >= self._currentWager * 2:
-            self._raiseButton.changeClickability(True, super().getDisplay(), 12)
+            self._raiseButton.changeClickability(True)
 
         # Buttons used to exit or start a new round
         if self._roundHasEnded and (not self._newRoundButton.isClickable() or not self._exitGameButton.isClickable()):
-            self._newRoundButton.changeClickability(True, super().getDisplay(), 10)
-            self._exitGameButton.changeClickability(True, super().getDisplay(), 12)
+            self._newRoundButton.changeClickability(True)
+            self._exitGameButton.changeClickability(True)
         elif not self._roundHasEnded and (self._newRoundButton.isClickable() or self._exitGameButton.isClickable()):
-            self._newRoundButton.changeClickability(False, super().getDisplay(), 10)
-            self._exitGameButton.changeClickability(False, super().getDisplay(), 12)
+            self._newRoundButton.changeClickability(False)
+            self._exitGameButton.changeClickability(False)
 
     def __displayNextCardSet(self):
         """  Displays the next card set in order of flop, fourth card, and last card  """
@@ -547,42 +761,19 @@ class PokerGame(GameBase):
         :param userHand: True if the current card hand being checked is the user's. False, if it's the computer's hand
         :return: the highest hand available, or the highest card if no card hand is present
         """
-        functions = ["isRoyalFlush", "isStraightFlush", "isFourOfAKind", "isFullHouse", "isFlush", "isStraight",
-                     "isThreeOfAKind", "isTwoPairs", "isOnePair"]
-
         if userHand:  # True if the current card hand being checked is the user's
-            cards = self._displayCards + [self._userCard1, self._userCard2]
+            holeCards = [self._userCard1, self._userCard2]
         else:
-            cards = self._displayCards + [self._computerCard1[0], self._computerCard2[0]]
-
-        # Calls each function in the list with every possible 5-card combination from the seven cards
-        for i in range(len(functions)):
-            for j in range(len(cards)):  # 7 (Gets every 6-card combination)
-                start, end = j, j + 6
-
-                if end >= len(cards) + 1:
-                    end = end - len(cards)
-                    specificCards = cards[start:] + cards[:end]
-                else:
-                    specificCards = cards[start:end]
+            holeCards = [self._computerCard1[0], self._computerCard2[0]]
 
-                for k in range(len(specificCards)):  # 6 (Gets every 5-card combination from every 6-card combination)
-                    start, end = k, k + 5
+        # Display cards which haven't been dealt yet aren't playing cards, so they can't be part of a hand
+        cardCodes = [card.getCode() for card in self._displayCards + holeCards if card.getCode() >= 0]
+        category = _evaluateHand(tuple(sorted(cardCodes)))
 
-                    if end >= len(specificCards) + 1:
-                        end = end - len(specificCards)
-                        temp = specificCards[start:] + specificCards[:end]
-                    else:
-                        temp = specificCards[start:end]
+        if category == len(self._CARD_HANDS) - 1:  # True if there's no pair, so the high card is used instead
+            return PokerGame.getHighCard(holeCards)
 
-                    # This line is only needed to show that the temp variable is being used
-                    variableName = [k for k, v in locals().items() if v == temp][0]
-
-                    # One of the nine functions with a unique 5-card set gets called here
-                    if eval("PokerGame." + functions[i] + "(" + variableName + ")"):
-                        return self._CARD_HANDS[i]
-
-        return PokerGame.getHighCard(cards[5:])
+        return self._CARD_HANDS[category]
 
     @staticmethod
     def getHighCard(cards):
@@ -591,12 +782,12 @@ class PokerGame(GameBase):
         :param cards: a list of Card objects
         :return: the highest card in the deck (2 is the lowest, Ace is the highest)
         """
-        cardRanking = Deck.TYPES[1:] + ["Ace"]
+        highestRank = max([card.getRankIndex() for card in cards], default=-1)
+
+        if highestRank < 0:  # True if none of the cards are playing cards
+            return None
 
-        for i in range(len(cardRanking) - 1, -1, -1):
-            for j in range(len(cards)):
-                if cardRanking[i] in cards[j].getCardName():
-                    return cardRanking[i]
+        return _RANK_ORDER[highestRank]
 
     @staticmethod
     def isFlush(cards):
@@ -605,21 +796,8 @@ class PokerGame(GameBase):
         :param cards: a list of Card objects to be checked
         :return: whether or not the deck of cards contains a flush
         """
-        cardNames = []
-        for card in cards:
-            cardNames.append(card.getCardName())
-
-        letter = 'o'
-        for i in range(len(cardNames)):
-            for j in range(len(cardNames[i])):
-                if cardNames[i][j] == 'C' or cardNames[i][j] == 'D' or cardNames[i][j] == 'H' or cardNames[i][j] == 'S':
-                    if i == 0:
-                        letter = cardNames[i][j]
-                        break
-                    elif letter != cardNames[i][j]:
-                        return False
-
-        return True
+        # Each suit is a single bit, so the bits only have something in common if every card has the same suit
+        return reduce(and_, [card.getSuitBit() for card in cards]) != 0
 
     @staticmethod
     def isStraight(cards):
@@ -628,43 +806,17 @@ class PokerGame(GameBase):
         :param cards: a list of Card objects to be checked
         :return: whether or not the deck of cards contains a straight
         """
-        temp = []
-        for card in cards:
-            temp.append(card.getCardName())
-
-        aList = Deck.TYPES[1:] + ["Ace"]
-
-        for i in range(len(temp)):
-            for j in range(i + 1, len(temp)):
-                v1, v2 = 0, 0
-
-                for k in range(len(aList)):
-                    if aList[k] == temp[i].split()[0]:
-                        v1 = k
-
-                for k in range(len(aList)):
-                    if aList[k] == temp[j].split()[0]:
-                        v2 = k
-
-                if v1 > v2:
-                    t = temp[j]
-                    temp[j] = temp[i]
-                    temp[i] = t
-
-        # Takes care of the problem of the ace either being high or low
-        if temp[4].split()[0] == "Ace" and temp[0].split()[0] == "Two":
-            temp.pop(4)
-
-        startListIndex = 0
-        for k in range(len(aList)):
-            if aList[k] == temp[0].split()[0]:
-                startListIndex = k
+        if len(cards) != 5:
+            return False
 
-        for i in range(1, len(temp)):
-            if temp[i].split()[0] != aList[startListIndex + i]:
+        rankMask = 0
+        for card in cards:
+            if card.getRankIndex() < 0:  # Cards which aren't playing cards don't have a rank
                 return False
+            rankMask |= 1 << card.getRankIndex()
 
-        return True
+        # Cards with the same rank share a bit, so a pair can never match one of the straights
+        return rankMask in _STRAIGHT_MASKS
 
     @staticmethod
     def isRoyalFlush(cards):
@@ -673,25 +825,11 @@ class PokerGame(GameBase):
         :param cards: a list of Card objects to be checked
         :return: whether or not the deck of cards contains a royal flush
         """
-        temp = []
-        for card in cards:
-            temp.append(card.getCardName())
-
-        needed = Deck.TYPES[9:] + ["Ace"]
         if not PokerGame.isFlush(cards):
             return False
 
-        for value in temp:
-            for i in range(len(needed)):
-                if value.split()[0] == needed[i]:
-                    needed[i] = "*"
-                    break
-
-        for s in needed:
-            if s != "*":
-                return False
-
-        return True
+        # Ten, Jack, Queen, King, Ace
+        return sorted([card.getRankIndex() for card in cards]) == [8, 9, 10, 11, 12]
 
     @staticmethod
     def isStraightFlush(cards):
@@ -702,6 +840,16 @@ class PokerGame(GameBase):
         """
         return PokerGame.isFlush(cards) and PokerGame.isStraight(cards)
 
+    @staticmethod
+    def getRankOccurrences(cards):
+        """
+        Counts how many times each card rank appears in a card hand
+        :param cards: a list of Card objects to be counted
+        :return: a list of 13 counts, one for each rank from Two to Ace
+        """
+        # Cards which aren't playing cards don't have a rank
+        return _countRanks([card.getCode() for card in cards if card.getCode() >= 0])
+
     @staticmethod
     def isXofAKind(cards, X):
         """
@@ -713,24 +861,7 @@ class PokerGame(GameBase):
         if X < 0 or X > 4:
             exit("Error - 'value' of a kind is too large or small")
 
-        temp = []
-        for card in cards:
-            temp.append(card.getCardName())
-
-        occurrences = [0] * len(Deck.TYPES)
-        aList = Deck.TYPES[1:] + ["Ace"]
-
-        # Gets the number of occurrences for each card
-        for i in range(len(temp)):
-            for j in range(len(aList)):
-                if aList[j] == temp[i].split()[0]:
-                    occurrences[j] += 1
-
-        for i in range(len(occurrences)):
-            if occurrences[i] == X:
-                return True
-
-        return False
+        return X in PokerGame.getRankOccurrences(cards)
 
     @staticmethod
     def isTwoPairs(cards):
@@ -739,24 +870,7 @@ class PokerGame(GameBase):
         :param cards: a list of Card objects to be checked
         :return: whether or not the deck of cards contains two pairs of different cards
         """
-        temp = []
-        for card in cards:
-            temp.append(card.getCardName())
-
-        occurrences = [0] * len(Deck.TYPES)
-        aList = Deck.TYPES[1:] + ["Ace"]
-
-        for i in range(len(temp)):
-            for j in range(len(aList)):
-                if aList[j] == temp[i].split()[0]:
-                    occurrences[j] += 1
-
-        num = 0
-        for i in range(len(occurrences)):
-            if occurrences[i] == 2:
-                num += 1
-
-        return num == 2
+        return PokerGame.getRankOccurrences(cards).count(2) == 2
 
     @staticmethod
     def isOnePair(cards):
@@ -783,7 +897,9 @@ class PokerGame(GameBase):
         :param cards: a list of Card objects to be checked
         :return: whether or not the deck of cards contains a full house
         """
-        return PokerGame.isXofAKind(cards, 3) and PokerGame.isXofAKind(cards, 2)
+        occurrences = PokerGame.getRankOccurrences(cards)  # Both counts come from the same set of rank counts
+
+        return 3 in occurrences and 2 in occurrences
 
     @staticmethod
     def isThreeOfAKind(cards):
@@ -801,46 +917,64 @@ class PokerGame(GameBase):
 
         # This loop continues while the window is still being displayed
         while True:
-            # Ends the computer's turn after one second from the start of the computer's turn
-            if self._computerHasTurn and time.time() - self._computerTurnStartTime > self._COMPUTER_WAIT_TIME:
-                self.__displayNextCardSet()
-                self._computerHasTurn = False
+            # No input is taken during the computer's turn, so the mouse doesn't need to be checked as often
+            if self._computerHasTurn:
+                fps = super().getIdleFramesPerSecond()
+            else:
+                fps = super().getFramesPerSecond()
 
-            for event in pygame.event.get():
+            # While nothing has changed, the loop sleeps until an event comes in (which wakes it up right away) or until
+            #   it's time to check if the mouse has moved. Events are read right after waiting, so input is never late
+            if self._needsRedraw:
+                events = pygame.event.get(self._HANDLED_EVENTS)
+            else:
+                firstEvent = pygame.event.wait(1000 // fps)
+                events = pygame.event.get(self._HANDLED_EVENTS)
+                if firstEvent.type != pygame.NOEVENT:
+                    events.insert(0, firstEvent)
+
+            super().updateTicks(1)
+
+            for event in events:
                 if event.type == pygame.QUIT:
                     super().quit()
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     self.mouseButtonDown(event.pos[0], event.pos[1])
                 elif event.type == pygame.KEYDOWN:
                     self.keyDown(event.key)
+                elif event.type == COMPUTER_MOVE_EVENT:  # Ends the computer's turn once it has waited long enough
+                    self.__displayNextCardSet()
+                    self._computerHasTurn = False
+                    self.__updateTextData()  # The computer's bet shows up once its turn is over
+                    self._clickabilityDirty = True
+
+            # Every event can change what's on the window, and so can moving the mouse (the buttons light up)
+            mousePos = pygame.mouse.get_pos()
+            if events or mousePos != self._lastMousePos:
+                super().requestRedraw()
+
+            # Checks to see if the clickability of any buttons needs updating (It can only change with the game state)
+            if self._clickabilityDirty:
+                self.__checkForClickabilityChanges()
+                self._clickabilityDirty = False
 
-            # Checks to see if the clickability of any buttons needs updating
-            self.__checkForClickabilityChanges()
-
-            # Update stuff and fill the window background
             super().update()
+
+            # Nothing gets redrawn while the window is idle
+            if not self._needsRedraw:
+                continue
+
+            self._needsRedraw = False
+            self._lastMousePos = mousePos
+
+            # Fill the window background
             GRAY = (30, 30, 30)
 
             super().getDisplay().fill(GRAY)
             super().draw()
 
-            # Don't display the buttons during the short period when it's the computer's turn
-            if not self._computerHasTurn and not self._roundHasEnded:
-                self.__displayButtonData()
-                self.__updateTextData()
-            elif self._computerHasTurn:
-                self.__displayComputerTurnText()  # Execute text when it's the computer's turn
-            elif self._roundHasEnded:
-                self.displayWinner()
-                self.__displayGameOptions()
-
-            # Displays other stuff on the canvas
-            self.__blitTextData()
+            # Displays the buttons and text on the canvas
+            self.__renderUI(mousePos, super().getDisplay())
 
             pygame.display.flip()
-            pygame.display.update()
-
-            fps = super().getFramesPerSecond()
-            super().getClock().tick(fps)
-            super().updateTicks(1)
 
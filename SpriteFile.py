@@ -2,9 +2,16 @@
 # The classes contained in this file is the ImageSprite class, the Card class which inherits from the ImageSprite class,
 #   and then the Deck class which implements objects of type Card
 
-from random import randint  # Used for card shuffling
+import random  # Used for card shuffling
+from collections import deque  # Cards can be added to and taken from either end of a deque quickly
 import pygame
 
+# Every image which has been loaded so far, keyed by its file name, so that each file is only loaded once
+_IMAGE_CACHE = {}
+
+# A unique prime number for each card rank (Two through Ace), so any set of ranks has its own unique product
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
 
 ##
 # A class which creates a general image sprite
@@ -22,15 +29,20 @@ class ImageSprite(pygame.sprite.Sprite):
 
     def loadImage(self, x, y, filename):
         """
-        Loads the image and makes any necessary pixels transparent, if need be.
+        Loads the image and makes any necessary pixels transparent, if need be. Sprites with the same file share the
+        same image, since the image itself never gets changed.
         :param x: the starting x-coordinate position of the sprite
         :param y: the starting y-coordinate position of the sprite
         :param filename: the name of the file containing the sprite
         """
         try:
-            img = pygame.image.load(filename).convert()
-            MAGENTA = (255, 0, 255)
-            img.set_colorkey(MAGENTA)
+            img = _IMAGE_CACHE.get(filename)
+
+            if img is None:
+                img = pygame.image.load(filename).convert()
+                MAGENTA = (255, 0, 255)
+                img.set_colorkey(MAGENTA, pygame.RLEACCEL)  # RLE makes blitting with a color key faster
+                _IMAGE_CACHE[filename] = img
 
             self.image = img
             self.rect = self.image.get_rect()
@@ -69,6 +81,26 @@ class Card(ImageSprite):
         self._cardType = cardType
         self._fileName = fileName
 
+        # Hidden cards are taken out of their sprite groups, so they don't get drawn at all until they're displayed
+        self._visible = True
+        self._hiddenGroups = []
+
+        # The name only gets split up once, instead of every time the type or suit is needed
+        parts = cardType.split()
+        self._type = parts[0] if len(parts) > 0 else cardType
+        self._suit = parts[2].split(".")[0] if len(parts) > 2 else None
+
+        # The rank (0 for Two up to 12 for Ace) and suit (a single bit) are stored as integers so that card hands can
+        #   be checked without any string parsing. Cards which aren't playing cards (e.g. "Empty") get a rank of -1
+        if self._type in Deck.TYPES and self._suit in Deck.SUITS:
+            self._rankIndex = (Deck.TYPES.index(self._type) - 1) % len(Deck.TYPES)
+            self._suitBit = 0x100 << Deck.SUITS.index(self._suit)
+            self._code = self._rankIndex * 4 + Deck.SUITS.index(self._suit)
+        else:
+            self._rankIndex = -1
+            self._suitBit = 0
+            self._code = -1
+
     def getCardName(self):
         """
         Gets the name of the current card.
@@ -81,20 +113,48 @@ class Card(ImageSprite):
         Gets the type of the card (Ace, 2, 3, ... 10, Jack, Queen, King)
         :return: the card's type
         """
-        return self._cardType.split()[0]
+        return self._type
 
     def getSuit(self):
         """
         Gets the suit of the card (Clubs, Diamonds, Hearts, Spades)
-        :return: the card's suit
+        :return: the card's suit, or None if the card isn't a playing card
         """
-        return self._cardType.split()[2].split(".")[0]
+        return self._suit
+
+    def getRankIndex(self):
+        """
+        Gets the rank of the card as an integer (0 for Two, 1 for Three, ... 12 for Ace)
+        :return: the card's rank index, or -1 if the card isn't a playing card
+        """
+        return self._rankIndex
+
+    def getSuitBit(self):
+        """
+        Gets the suit of the card as a single bit (0x100 for Clubs, 0x200 for Diamonds, 0x400 for Hearts, 0x800 for
+        Spades)
+        :return: the card's suit bit, or 0 if the card isn't a playing card
+        """
+        return self._suitBit
+
+    def getCode(self):
+        """
+        Gets a unique code for the card, where the rank index is in the upper bits and the suit (0 for Clubs up to 3 for
+        Spades) is in the lowest two bits
+        :return: the card's code from 0 to 51, or -1 if the card isn't a playing card
+        """
+        return self._code
 
     def hideCard(self):
         """
-        Hides the card from the user (Moves it off screen from the canvas)
+        Hides the card from the user (Takes it out of the sprite groups which draw it, until it's displayed again)
         """
-        self.moveBy(-self.rect.x - self._CARD_WIDTH, -self.rect.y - self._CARD_LENGTH)
+        if not self._visible:
+            return
+
+        self._visible = False
+        self._hiddenGroups = self.groups()
+        self.kill()
 
     def displayCardAtGivenPos(self, x, y):
         """
@@ -104,6 +164,10 @@ class Card(ImageSprite):
         """
         self.moveBy(x - self.rect.x, y - self.rect.y - self._CARD_LENGTH)
 
+        if not self._visible:
+            self._visible = True
+            self.add(*self._hiddenGroups)
+
 
 ##
 # A class which simulates a deck of cards
@@ -117,8 +181,9 @@ class Deck:
         Creates a CardDeck which is made up of a list of different Card objects.
         :param deckMultiple: the number of 52-card decks to add to a single card deck
         """
-        self._cardsInDeck = []
-        self._cardsOutOfDeck = []
+        self._cardsInDeck = deque()
+        self._cardsOutOfDeck = deque()
+        self._outOfDeckSet = set()  # The same cards as _cardsOutOfDeck, so checking if a card was drawn is quick
         self._deckMultiple = deckMultiple
 
         for i in range(self._deckMultiple):
@@ -127,14 +192,15 @@ class Deck:
                     name = aType + " of " + aSuit
                     self._cardsInDeck.append(Card(name, 0, 0, "DECK_export/" + name + ".gif"))
 
-    def shuffle(self):
+    def shuffle(self, rng=random):
         """
         Shuffles the deck by randomizing the card elements in the list.
+        :param rng: the random number generator used to shuffle the cards (e.g. a seeded random.Random, so that the
+                    shuffle can be repeated)
         """
-        for i in range(len(self._cardsInDeck)):
-            num = randint(i, len(self._cardsInDeck) - 1)
-            aCard = self._cardsInDeck.pop(num)
-            self._cardsInDeck.insert(0, aCard)
+        cards = list(self._cardsInDeck)  # Shuffling swaps cards by index, which is slow in the middle of a deque
+        rng.shuffle(cards)
+        self._cardsInDeck = deque(cards)
 
     def getNumOfCardsInDeck(self):
         """
@@ -143,6 +209,13 @@ class Deck:
         """
         return len(self._cardsInDeck)
 
+    def getCardsInDeck(self):
+        """
+        Gets all of the cards which haven't been drawn, without taking them out of the deck.
+        :return: a list of the cards left in the deck
+        """
+        return list(self._cardsInDeck)
+
     def getDeckMultiple(self):
         """
         Gets the deck multiple (The number of 52-card decks contained in this deck).
@@ -154,8 +227,9 @@ class Deck:
         """
         Takes all of the cards which have been drawn out of the deck and puts them back into the card deck at the bottom
         """
-        self._cardsInDeck = self._cardsOutOfDeck + self._cardsInDeck
-        self._cardsOutOfDeck = []
+        self._cardsInDeck.extendleft(reversed(self._cardsOutOfDeck))  # Reversed, so the cards keep their order
+        self._cardsOutOfDeck.clear()
+        self._outOfDeckSet.clear()
 
     def addSpecificCardsBackIntoDeck(self, cardList):
         """
@@ -163,20 +237,14 @@ class Deck:
         bottom.
         :param cardList: a list of card objects which will be added into the card deck
         """
-        for i in range(len(cardList)):
-            if not self.__isInDeck(cardList[i], self._cardsOutOfDeck):  # Makes sure that the card belongs to the deck
-                cardList[i] = '0'
-            else:
-                for j in range(len(self._cardsOutOfDeck)):
-                    if cardList[i].getType() == self._cardsOutOfDeck[j].getType():
-                        self._cardsOutOfDeck.pop(j)
-                        break
-
-        # Any elements containing this value were once Card objects which weren't allowed in the main card deck
-        while '0' in cardList:
-            cardList.remove('0')
+        cardsToAdd = []
+        for card in cardList:
+            if card in self._outOfDeckSet:  # Only cards which were drawn from this deck are allowed back into it
+                self._outOfDeckSet.remove(card)
+                self._cardsOutOfDeck.remove(card)
+                cardsToAdd.append(card)
 
-        self._cardsInDeck = cardList + self._cardsInDeck  # Cards get added to the bottom of the deck
+        self._cardsInDeck.extendleft(reversed(cardsToAdd))  # Cards get added to the bottom of the deck
 
     def getCardFromDeck(self):
         """
@@ -189,6 +257,7 @@ class Deck:
 
         topCard = self._cardsInDeck.pop()
         self._cardsOutOfDeck.append(topCard)
+        self._outOfDeckSet.add(topCard)
 
         return topCard
 
@@ -203,25 +272,12 @@ class Deck:
         except IndexError:
             exit("Index value " + str(index) + " is out of bounds from range 0-" + str(len(self._cardsInDeck) - 1))
 
-    @staticmethod
-    def __isInDeck(cardParam, deckOfCards):
-        """
-        Checks to see if a card with a specific name exists in a deck of cards.
-        :param cardParam: the card, whose name is being checked for in a list of other cards
-        :param deckOfCards: a list of cards to be checked to see if a specific card name exists in that deck
-        :return: whether or not the card is in the card deck
-        """
-        for card in deckOfCards:
-            if cardParam.getType() == card.getType():
-                return True
-
-        return False
-
 
 ##
 # A button which can be displayed and clicked
 #
 class Button:
+    _FONT_CACHE = {}  # Fonts which have already been loaded, keyed by their (name, size, bold) values
 
     def __init__(self, color, x, y, width, height, text="", clickable=True):
         """
@@ -237,30 +293,45 @@ class Button:
         self._clickable = clickable
         self._nonClickableColor = (30, 30, 30)
         self._color = color
+        self._hoverColor = Button.getDifferentColorShade(color, 20)  # The color when the mouse is over the button
         self._x = x
         self._y = y
         self._width = width
         self._height = height
+        self._rect = pygame.Rect(x, y, width, height)
         self._text = text
 
-    def drawButton(self, window, fontSize):
+        # The text is only rendered again when the text or its font size changes
+        self._textSurface = None
+        self._cachedText = None
+        self._cachedFontSize = None
+
+    def drawButton(self, window, fontSize, mousePos=None):
         """
         Draws a button and blits the appropriate text onto the button.
         @param window the window in which the button will be displayed
         @param fontSize the size of the text font that will be placed on the button
+        @param mousePos the current mouse position, if it's already known (Otherwise it gets looked up)
         """
+        if mousePos is None:
+            mousePos = pygame.mouse.get_pos()
+
         # The color of the button rectangle is drawn
-        if self.mouseIsOver(pygame.mouse.get_pos()) and self._clickable:
-            pygame.draw.rect(window, self.getDifferentColorShade(self._color, 20),
-                             (self._x, self._y, self._width, self._height), 0)
+        if self.mouseIsOver(mousePos) and self._clickable:
+            pygame.draw.rect(window, self._hoverColor, self._rect, 0)
         elif not self._clickable:
-            pygame.draw.rect(window, self._nonClickableColor, (self._x, self._y, self._width, self._height), 0)
+            pygame.draw.rect(window, self._nonClickableColor, self._rect, 0)
         else:
-            pygame.draw.rect(window, self._color, (self._x, self._y, self._width, self._height), 0)
+            pygame.draw.rect(window, self._color, self._rect, 0)
 
         if self._text != "" and self._clickable:
-            font = pygame.font.SysFont("Arial", int(fontSize), True)
-            text = font.render(self._text, True, (0, 0, 0))
+            if self._text != self._cachedText or fontSize != self._cachedFontSize:
+                font = Button.getFont("Arial", int(fontSize), True)
+                self._textSurface = font.render(self._text, True, (0, 0, 0))
+                self._cachedText = self._text
+                self._cachedFontSize = fontSize
+
+            text = self._textSurface
 
             window.blit(text, (self._x + (self._width / 2 - text.get_width() / 2),
                                self._y + (self._height / 2 - text.get_height() / 2)))
@@ -278,23 +349,14 @@ class Button:
         :param pos: the current mouse position to be checked
         :return: whether or not the mouse is over the button
         """
-        if self._x < pos[0] < self._x + self._width and self._y < pos[1] < self._y + self._height:
-            return True
-
-        return False
+        return self._rect.collidepoint(pos)
 
-    def changeClickability(self, clickable, window, fontSize):
+    def changeClickability(self, clickable):
         """
-        Changes whether or not a button is currently clickable.
+        Changes whether or not a button is currently clickable. The new look shows up the next time it's drawn.
         :param clickable: makes the button clickable if True and not clickable if False
-        :param window: the window in which the button will be displayed
-        :param fontSize: the size of the font for the text which is part of the button
         """
-        if self._clickable == clickable:
-            return
-
         self._clickable = clickable
-        self.drawButton(window, fontSize)
 
     def isClickable(self):
         """
@@ -303,6 +365,21 @@ class Button:
         """
         return self._clickable
 
+    @staticmethod
+    def getFont(name, size, bold):
+        """
+        Gets a system font, which is only loaded the first time it's needed.
+        :param name: the name of the font
+        :param size: the size of the font
+        :param bold: whether or not the font is bold
+        :return: the font
+        """
+        key = name, size, bold
+        if key not in Button._FONT_CACHE:
+            Button._FONT_CACHE[key] = pygame.font.SysFont(name, size, bold)
+
+        return Button._FONT_CACHE[key]
+
     @staticmethod
     def getDifferentColorShade(color, amount):
         """